@@ -11,18 +11,22 @@ Usage:
 """
 import os
 import sys
-import site
-import platform
+import locale
 import sysconfig
-import ctypes
+import functools
 from pathlib import Path
 
+_IS_WINDOWS  = sys.platform == "win32"
+_IS_MAC      = sys.platform == "darwin"
+_SCRIPTS_DIR = Path(sysconfig.get_path("scripts"))
+
 try:
     from cdp_dev.utils import is_admin_windows as _is_admin
 except ImportError:
     # Fallback if cdp_dev package is not in path
     def _is_admin() -> bool:
         try:
+            import ctypes
             return ctypes.windll.shell32.IsUserAnAdmin() != 0
         except Exception:
             return False
@@ -31,36 +35,77 @@ except ImportError:
 # ── Find cdp-dev.exe wherever pip installed it ────────────────────────────────
 
 def find_cdpdev_exe() -> Path | None:
-    exe_name = "cdp-dev.exe" if platform.system() == "Windows" else "cdp-dev"
+    exe_name = "cdp-dev.exe" if _IS_WINDOWS else "cdp-dev"
+
+    # Common case: pip put it next to this interpreter's scripts
+    primary = _SCRIPTS_DIR / exe_name
+    try:
+        os.stat(primary)
+        return primary
+    except OSError:
+        pass
+
+    # Miss — only now build (and cache) the full candidate list.
+    # One directory enumeration per candidate instead of a stat/open per
+    # probe — on Windows each exists() is a full CreateFileW round-trip.
     for candidate in _candidate_dirs():
-        exe = candidate / exe_name
-        if exe.exists():
-            return exe
+        try:
+            it = os.scandir(candidate)
+        except OSError:
+            continue
+        with it:
+            for e in it:
+                if e.name.lower() == exe_name and e.is_file():
+                    return Path(e.path)
     return None
 
 
-def _candidate_dirs() -> list:
-    dirs = []
+@functools.lru_cache(maxsize=1)
+def _candidate_dirs() -> tuple[Path, ...]:
+    """
+    Directories pip may have put cdp-dev into, most likely first.
+    Cached so the "Searched in" report on a miss reuses the same scan.
+    """
+    # Keyed on the normalized path so the same directory reached twice
+    # (e.g. user base == sysconfig scripts, or differing case on Windows)
+    # is only probed once; dicts keep the most-likely-first order.
+    seen = {}
+
+    def _add(p: Path):
+        seen.setdefault(os.path.normcase(os.path.normpath(str(p))), p)
 
     # 1. sysconfig default
-    dirs.append(Path(sysconfig.get_path("scripts")))
+    _add(_SCRIPTS_DIR)
 
     # 2. user base
+    import site
     if hasattr(site, "getuserbase"):
         base = Path(site.getuserbase())
-        dirs.append(base / ("Scripts" if platform.system() == "Windows" else "bin"))
+        _add(base / ("Scripts" if _IS_WINDOWS else "bin"))
 
     # 3. Microsoft Store Python — scan all versions
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         packages = Path.home() / "AppData" / "Local" / "Packages"
-        if packages.exists():
-            for pkg in sorted(packages.glob("PythonSoftwareFoundation.Python.*"), reverse=True):
-                local = pkg / "LocalCache" / "local-packages"
-                if local.exists():
-                    for py_ver in sorted(local.glob("Python*"), reverse=True):
-                        dirs.append(py_ver / "Scripts")
+        for pkg in _scan_prefix(packages, "PythonSoftwareFoundation.Python."):
+            for py_ver in _scan_prefix(pkg / "LocalCache" / "local-packages", "Python"):
+                _add(py_ver / "Scripts")
+
+    return tuple(seen.values())
+
 
-    return dirs
+def _scan_prefix(root: Path, prefix: str) -> list:
+    """
+    Subdirectories of root whose name starts with prefix, highest name first.
+    One scandir per level; the dirent type answers is_dir() without a stat.
+    """
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return []
+    with it:
+        entries = [e for e in it if e.name.startswith(prefix) and e.is_dir(follow_symlinks=False)]
+    entries.sort(key=lambda e: e.name, reverse=True)
+    return [Path(e.path) for e in entries]
 
 
 # ── Windows: write cdp-dev.bat into System32 ─────────────────────────────────
@@ -71,7 +116,10 @@ def _relaunch_as_admin():
     print("  Administrator access needed to write to C:\\Windows\\System32.")
     print("  Windows will show a UAC prompt — click Yes to continue.")
     print()
-    params = " ".join(f'"{a}"' for a in sys.argv)
+    import ctypes
+    import subprocess
+    # Windows' own quoting rules — survives embedded quotes and trailing backslashes
+    params = subprocess.list2cmdline(sys.argv)
     ret = ctypes.windll.shell32.ShellExecuteW(
         None, "runas", sys.executable, params, None, 1
     )
@@ -94,6 +142,17 @@ def install_bat_wrapper(cdp_exe: Path):
 
     bat_content = f'@echo off\n"{cdp_exe}" %*\n'
 
+    # Read first — if the wrapper already points here there's nothing to
+    # write, so skip the UAC prompt entirely. Windows paths compare
+    # case-insensitively.
+    try:
+        current = bat_path.read_text()
+    except OSError:
+        current = ""
+    if str(cdp_exe).lower() in current.lower():
+        print(f"  ✓  {bat_path} already points to {cdp_exe}")
+        return
+
     print(f"  Writing wrapper: {bat_path}")
     print(f"  Points to     : {cdp_exe}")
 
@@ -101,7 +160,14 @@ def install_bat_wrapper(cdp_exe: Path):
         _relaunch_as_admin()
 
     try:
-        bat_path.write_text(bat_content)
+        # A ~30-byte file: write the bytes directly rather than through the
+        # text-IO stack. CRLF kept explicit since write_text used to add it.
+        data = bat_content.replace("\n", "\r\n").encode(locale.getpreferredencoding(False))
+        fd = os.open(str(bat_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
         print(f"  ✓  Installed cdp-dev.bat → {bat_path}")
         print()
         print("  cdp-dev is now available in EVERY terminal, immediately.")
@@ -123,17 +189,25 @@ def fix_unix(scripts_dir: Path):
     if "zsh" in shell:
         rc = home / ".zshrc"
     elif "bash" in shell:
-        rc = home / ".bash_profile" if platform.system() == "Darwin" else home / ".bashrc"
+        rc = home / ".bash_profile" if _IS_MAC else home / ".bashrc"
     else:
         rc = home / ".profile"
 
-    content = rc.read_text() if rc.exists() else ""
-    if scripts_str in content:
+    # Raw-bytes check (no decode), then a single O_APPEND write
+    try:
+        with open(rc, "rb") as f:
+            present = os.fsencode(scripts_str) in f.read()
+    except OSError:
+        present = False
+    if present:
         print(f"  ✓  Already in {rc}")
         return
 
-    with open(rc, "a") as f:
-        f.write(f"\n# cdp-local-dev\nexport PATH=\"{scripts_str}:$PATH\"\n")
+    fd = os.open(rc, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, os.fsencode(f"\n# cdp-local-dev\nexport PATH=\"{scripts_str}:$PATH\"\n"))
+    finally:
+        os.close(fd)
 
     os.environ["PATH"] = scripts_str + ":" + os.environ.get("PATH", "")
     print(f"  ✓  Added to {rc}")
@@ -164,7 +238,7 @@ def main():
     print(f"  ✓  Found: {exe}")
     print()
 
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         install_bat_wrapper(exe)
     else:
         fix_unix(exe.parent)
@@ -8,13 +8,31 @@ Can be invoked two ways:
 On first run, automatically installs cdp-dev.bat into System32
 so `cdp-dev` works in every terminal from that point on.
 """
+import importlib
+
 import click
-from rich.console import Console
 
-console = Console()
 
+class LazyGroup(click.Group):
+    """
+    Imports a subcommand's module only when that subcommand is invoked,
+    so `cdp-dev status` doesn't pay for loading helm/kind/preflight code.
+    Each command lives in cdp_dev/commands/<name>.py as a function <name>.
+    """
+
+    COMMANDS = ["install", "start", "stop", "status", "logs", "destroy"]
+
+    def list_commands(self, ctx):
+        return list(self.COMMANDS)
 
-@click.group()
+    def get_command(self, ctx, name):
+        if name not in self.COMMANDS:
+            return None
+        mod = importlib.import_module(f"cdp_dev.commands.{name}")
+        return getattr(mod, name)
+
+
+@click.group(cls=LazyGroup)
 @click.version_option(version="0.1.0", prog_name="cdp-dev")
 def main():
     """
@@ -40,17 +58,3 @@ def main():
     from cdp_dev.path_helper import ensure_cdpdev_globally_accessible
     ensure_cdpdev_globally_accessible()
 
-
-from cdp_dev.commands.install import install
-from cdp_dev.commands.start   import start
-from cdp_dev.commands.stop    import stop
-from cdp_dev.commands.status  import status
-from cdp_dev.commands.logs    import logs
-from cdp_dev.commands.destroy import destroy
-
-main.add_command(install)
-main.add_command(start)
-main.add_command(stop)
-main.add_command(status)
-main.add_command(logs)
-main.add_command(destroy)
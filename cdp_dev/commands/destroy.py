@@ -1,8 +1,7 @@
 import click
-from rich.console import Console
 from rich.rule import Rule
 
-console = Console()
+from cdp_dev.utils import console
 
 
 @click.command()
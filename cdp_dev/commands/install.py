@@ -1,10 +1,8 @@
-import platform
 import click
-from rich.console import Console
 from rich.rule import Rule
 from rich.panel import Panel
 
-console = Console()
+from cdp_dev.utils import IS_WINDOWS, console
 
 CLUSTER_NAME = "cdp-local"
 
@@ -49,7 +47,7 @@ def install(skip_preflight, skip_image_preload):
     """First-time setup: create Kind cluster and install Airflow (~5-10 min)."""
     from cdp_dev.preflight    import run_preflight
     from cdp_dev.kind_manager import create_cluster, get_kubeconfig
-    from cdp_dev.helm_manager import add_repos, install_airflow
+    from cdp_dev.helm_manager import add_repos, install_airflow, start_repo_update
     from cdp_dev.port_forward import start_all
     from cdp_dev.path_helper  import ensure_cdpdev_globally_accessible, is_cdpdev_on_path
 
@@ -62,7 +60,7 @@ def install(skip_preflight, skip_image_preload):
     console.print()
 
     # ── Step 0: Make cdp-dev available system-wide ─────────────────────────
-    if platform.system() == "Windows":
+    if IS_WINDOWS:
         console.print(Rule("[bold]Step 0  —  System PATH[/bold]"))
         ensure_cdpdev_globally_accessible()
         if is_cdpdev_on_path():
@@ -81,6 +79,10 @@ def install(skip_preflight, skip_image_preload):
     # ── Docker memory check (soft warning) ────────────────────────────────
     _check_docker_memory()
 
+    # Helm repo download has no dependency on Kind — overlap it with
+    # cluster creation and collect the result in Step 3.
+    repos = start_repo_update()
+
     # ── Step 2: Kind Cluster ───────────────────────────────────────────────
     console.print()
     console.print(Rule("[bold]Step 2 of 4  —  Kind Cluster[/bold]"))
@@ -90,7 +92,7 @@ def install(skip_preflight, skip_image_preload):
     # ── Step 3: Helm Repos ─────────────────────────────────────────────────
     console.print()
     console.print(Rule("[bold]Step 3 of 4  —  Helm Repositories[/bold]"))
-    add_repos()
+    add_repos(pending=repos)
 
     # ── Step 4: Airflow ────────────────────────────────────────────────────
     console.print()
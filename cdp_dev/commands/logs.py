@@ -1,9 +1,9 @@
+import os
 import subprocess
 import sys
 import click
-from rich.console import Console
 
-console = Console()
+from cdp_dev.utils import console
 
 SERVICE_MAP = {
     "airflow":    ("airflow",  "app.kubernetes.io/name=airflow"),
@@ -47,6 +47,21 @@ def logs(service, lines, follow):
 
     console.print(f"\n[cyan]  Tailing [bold]{service}[/bold] logs "
                   f"(namespace: {ns}) — Ctrl+C to stop[/cyan]\n")
+
+    if os.name == "posix" and not follow:
+        # A one-shot dump ends on its own and there's nothing left to do
+        # after kubectl: become it rather than keep a Python parent
+        # waiting on the child. A followed stream stays a child so Ctrl+C
+        # still gets the "stopped" message below.
+        sys.stdout.flush()
+        try:
+            os.execvp(cmd[0], cmd)
+        except OSError as e:
+            console.print(f"[red]  ✗  Could not run kubectl: {e}[/red]")
+            sys.exit(1)
+
+    # Windows has no real exec (os.execvp spawns and exits, detaching the
+    # console), so always wait on a child there.
     try:
         subprocess.run(cmd)
     except KeyboardInterrupt:
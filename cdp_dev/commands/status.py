@@ -1,11 +1,20 @@
+import json
 import subprocess
 import click
-from rich.console import Console
-from rich.table import Table
 from rich.rule import Rule
-from rich import box
 
-console = Console()
+from cdp_dev.utils import console
+
+# Rich markup per pod phase / ready flag; anything unlisted is an error phase
+_PHASE_FMT = {
+    "Running": "[green]Running[/green]",
+    "Pending": "[cyan]Pending[/cyan]",
+    "<none>":  "[yellow]Unknown[/yellow]",
+}
+_READY_FMT = {
+    "true":  "[green]✓[/green]",
+    "false": "[red]✗[/red]",
+}
 
 
 def _kubectl(args: list) -> str:
@@ -20,7 +29,9 @@ def _kubectl(args: list) -> str:
 @click.command()
 def status():
     """Show the health of all local CDP pods and port-forwards."""
-    from cdp_dev.kind_manager import cluster_exists, cluster_running
+    from rich.table import Table
+    from rich import box
+    from cdp_dev.kind_manager import cluster_state
     from cdp_dev.port_forward import status as pf_status
 
     console.print()
@@ -28,8 +39,7 @@ def status():
     console.print()
 
     # ── Cluster status ─────────────────────────────────────────────────────
-    exists  = cluster_exists()
-    running = cluster_running()
+    exists, running = cluster_state()
 
     if not exists:
         console.print("[red]  ✗  Cluster 'cdp-local' does not exist.[/red]")
@@ -45,9 +55,13 @@ def status():
         return
 
     # ── Pod status ─────────────────────────────────────────────────────────
+    # Completed Job pods (e.g. Airflow migrations) are skipped server-side
     raw = _kubectl(["get", "pods", "--all-namespaces",
-                    "-o", "custom-columns=NS:.metadata.namespace,NAME:.metadata.name,"
-                           "STATUS:.status.phase,READY:.status.containerStatuses[0].ready"])
+                    "--field-selector=status.phase!=Succeeded", "-o", "json"])
+    try:
+        items = json.loads(raw).get("items", []) if raw else []
+    except ValueError:
+        items = []
 
     pod_table = Table(title="Pods", box=box.ROUNDED, show_lines=True)
     pod_table.add_column("Namespace", style="cyan",   no_wrap=True)
@@ -55,29 +69,19 @@ def status():
     pod_table.add_column("Status",    justify="center")
     pod_table.add_column("Ready",     justify="center")
 
-    lines = [l for l in raw.splitlines() if l.strip() and "NS" not in l]
-    if not lines:
+    if not items:
         console.print("[yellow]  No pods found. The cluster may still be starting.[/yellow]")
     else:
-        for line in lines:
-            parts = line.split()
-            if len(parts) < 3:
-                continue
-            ns, name = parts[0], parts[1]
-            phase    = parts[2] if len(parts) > 2 else "—"
-            ready    = parts[3] if len(parts) > 3 else "—"
-
-            phase_fmt = (
-                "[green]Running[/green]"   if phase == "Running"   else
-                "[cyan]Pending[/cyan]"     if phase == "Pending"   else
-                "[yellow]Unknown[/yellow]" if phase == "<none>"    else
-                f"[red]{phase}[/red]"
-            )
-            ready_fmt = (
-                "[green]✓[/green]" if ready == "true"  else
-                "[red]✗[/red]"     if ready == "false" else
-                "[dim]—[/dim]"
-            )
+        for item in items:
+            meta     = item.get("metadata", {})
+            pod_st   = item.get("status", {})
+            ns, name = meta.get("namespace", "—"), meta.get("name", "—")
+            phase    = pod_st.get("phase", "<none>")
+            ready    = (pod_st.get("containerStatuses") or [{}])[0].get("ready")
+            ready    = "—" if ready is None else str(ready).lower()
+
+            phase_fmt = _PHASE_FMT.get(phase) or f"[red]{phase}[/red]"
+            ready_fmt = _READY_FMT.get(ready, "[dim]—[/dim]")
             pod_table.add_row(ns, name, phase_fmt, ready_fmt)
 
         console.print(pod_table)
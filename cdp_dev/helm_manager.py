@@ -2,20 +2,17 @@
 helm_manager.py — installs Airflow via Helm into the Kind cluster.
 Helm only creates resources — we watch and report progress ourselves.
 """
+import base64
+import json
 import subprocess
 import sys
+import threading
 import time
-import yaml
+from concurrent.futures import Future
 from pathlib import Path
 
-from rich.console import Console
-from rich.live import Live
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
-
-console = Console()
+from . import kube_proxy
+from .utils import IS_WINDOWS, console, helm_dir, tool_path
 
 AIRFLOW_CHART_VERSION = "1.15.0"
 AIRFLOW_IMAGE_TAG     = "2.9.3"
@@ -23,34 +20,47 @@ AIRFLOW_IMAGE         = f"apache/airflow:{AIRFLOW_IMAGE_TAG}"
 
 
 def _run(cmd: list, check: bool = True, capture: bool = False) -> subprocess.CompletedProcess:
+    cmd = [tool_path(cmd[0])] + cmd[1:]
     return subprocess.run(cmd, check=check, capture_output=capture, text=True)
 
 
-def _helm_dir() -> Path:
-    pkg = Path(__file__).parent / "helm"
-    if pkg.exists():
-        return pkg
-    repo = Path(__file__).parent.parent / "helm"
-    if repo.exists():
-        return repo
-    raise FileNotFoundError("Cannot locate helm/ directory. Reinstall cdp-local-dev.")
+def _yaml_codec():
+    """
+    PyYAML plus the fastest safe loader/dumper it offers — libyaml's C
+    implementation (~10x faster) when built with it, else pure Python.
+    Imported here so commands that never touch values files skip it.
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeLoader as Loader, SafeDumper as Dumper
+    return yaml, Loader, Dumper
 
 
 def _sanitize_airflow_values(values_path: Path):
+    yaml, Loader, Dumper = _yaml_codec()
+
+    def dump(v: dict) -> str:
+        return yaml.dump(v, Dumper=Dumper, default_flow_style=False, allow_unicode=True)
+
     with open(values_path, "r") as f:
-        values = yaml.safe_load(f)
-    changed = False
+        values = yaml.load(f, Loader=Loader)
+    # Only rewrite the file if sanitizing actually changes it — a re-run
+    # leaves it (and any comments the user added) untouched.
+    before = dump(values)
 
     svc = values.get("webserver", {}).get("service", {})
     if svc.get("type") == "NodePort" or "nodePort" in svc or "ports" in svc:
-        values.setdefault("webserver", {})["service"] = {"type": "ClusterIP"}
-        changed = True
+        # Targeted fix — keep annotations etc. the user put on the service
+        svc.pop("nodePort", None)
+        svc.pop("ports", None)
+        svc["type"] = "ClusterIP"
         console.print("[yellow]  ⚠  Fixed: webserver.service → ClusterIP[/yellow]")
 
     if not _is_valid_fernet_key(values.get("fernetKey", "")):
         from cryptography.fernet import Fernet
         values["fernetKey"] = Fernet.generate_key().decode()
-        changed = True
         console.print("[yellow]  ⚠  Fixed: generated valid Fernet key[/yellow]")
 
     # Remove keys that fail schema validation in this chart version
@@ -62,32 +72,76 @@ def _sanitize_airflow_values(values_path: Path):
     values["images"]["airflow"]["repository"] = "apache/airflow"
     values["images"]["airflow"]["tag"]        = AIRFLOW_IMAGE_TAG
     values["images"]["airflow"]["pullPolicy"] = "IfNotPresent"
-    changed = True
 
-    if changed:
+    after = dump(values)
+    if after != before:
         with open(values_path, "w") as f:
-            yaml.dump(values, f, default_flow_style=False, allow_unicode=True)
+            f.write(after)
 
 
 def _is_valid_fernet_key(key: str) -> bool:
+    # A Fernet key is 32 bytes urlsafe-base64 encoded: always 44 chars
+    # ending in "=". Reject anything else before paying for a decode.
+    if not isinstance(key, str) or len(key) != 44 or not key.endswith("="):
+        return False
     try:
-        import base64
         return len(base64.urlsafe_b64decode(key.encode())) == 32
     except Exception:
         return False
 
 
-def add_repos():
+def _update_repos() -> str:
+    """
+    Add/refresh the apache-airflow chart repo without printing, so it can
+    run in the background while another step owns the terminal.
+    Returns helm's error output on failure, "" on success.
+    """
+    for cmd in (["helm", "repo", "add", "apache-airflow",
+                 "https://airflow.apache.org", "--force-update"],
+                ["helm", "repo", "update"]):
+        result = _run(cmd, check=False, capture=True)
+        if result.returncode != 0:
+            return (result.stderr or result.stdout).strip()
+    return ""
+
+
+def start_repo_update() -> Future:
+    """
+    Kick off the chart index download now. It only needs the network,
+    not the cluster, so it can overlap Kind cluster creation.
+    Pass the returned future to add_repos().
+
+    Runs on a daemon thread rather than an executor worker: if cluster
+    creation fails and we exit, the interpreter must not sit joining a
+    `helm repo update` nobody will read.
+    """
+    future: Future = Future()
+
+    def _work():
+        try:
+            future.set_result(_update_repos())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=_work, daemon=True).start()
+    return future
+
+
+def add_repos(pending: Future | None = None):
     console.print("[cyan]  Adding Helm repo: apache-airflow[/cyan]")
-    _run(["helm", "repo", "add", "apache-airflow",
-          "https://airflow.apache.org", "--force-update"])
-    _run(["helm", "repo", "update"])
+    err = pending.result() if pending is not None else _update_repos()
+    if err:
+        console.print(f"[bold red]✗  Helm repo update failed:[/bold red]\n{err}")
+        sys.exit(1)
     console.print("[green]  ✓  Helm repos updated.[/green]")
 
 
 def create_namespace(ns: str):
-    result = _run(["kubectl", "get", "namespace", ns], check=False, capture=True)
-    if result.returncode != 0:
+    code = kube_proxy.status_code(f"/api/v1/namespaces/{ns}")
+    if code is None:   # proxy unavailable — ask kubectl directly
+        result = _run(["kubectl", "get", "namespace", ns], check=False, capture=True)
+        code = 200 if result.returncode == 0 else 404
+    if code != 200:
         _run(["kubectl", "create", "namespace", ns])
         console.print(f"[green]  ✓  Namespace '{ns}' created.[/green]")
     else:
@@ -112,7 +166,6 @@ def preload_airflow_image(cluster_name: str = "cdp-local"):
       - If kind load fails for any reason, warn and continue — Kubernetes will
         pull from Docker Hub inside the Kind node (slower but always works)
     """
-    import platform
     console.print(f"[cyan]  Pre-loading image into Kind cluster (avoids in-cluster pull)...[/cyan]")
     console.print(f"[dim]  Image: {AIRFLOW_IMAGE}[/dim]")
 
@@ -130,7 +183,7 @@ def preload_airflow_image(cluster_name: str = "cdp-local"):
     # Step 2: kind load — skip silently on Windows when it is known to be flaky
     # On Windows+Docker Desktop the image is already accessible to Kind through
     # the shared Docker daemon, so kind load is not strictly necessary.
-    if platform.system() == "Windows":
+    if IS_WINDOWS:
         console.print(f"[dim]  Skipping kind load on Windows (Docker Desktop shares the image automatically).[/dim]")
         console.print(f"[green]  ✓  Image ready (pod scheduling will use the cached Docker image).[/green]")
         return
@@ -156,50 +209,172 @@ def preload_airflow_image(cluster_name: str = "cdp-local"):
 
 # ── Pod / Job inspection helpers ──────────────────────────────────────────────
 
-def _get_pods(namespace: str) -> list:
-    result = _run(
-        ["kubectl", "get", "pods", "-n", namespace, "--no-headers",
-         "-o", "custom-columns="
-               "NAME:.metadata.name,"
-               "READY:.status.containerStatuses[0].ready,"
-               "STATUS:.status.phase,"
-               "RESTARTS:.status.containerStatuses[0].restartCount"],
-        check=False, capture=True
-    )
-    pods = []
-    for line in result.stdout.splitlines():
-        parts = line.split()
-        if len(parts) >= 3:
-            pods.append({
-                "name":     parts[0],
-                "ready":    parts[1] if len(parts) > 1 else "false",
-                "status":   parts[2] if len(parts) > 2 else "Unknown",
-                "restarts": parts[3] if len(parts) > 3 else "0",
-            })
-    return pods
+def _kubectl_items(args: list) -> list | None:
+    """Run `kubectl get ... -o json` and return its items (None on any failure)."""
+    result = _run(["kubectl", "get"] + args + ["-o", "json"], check=False, capture=True)
+    if result.returncode != 0:
+        return None
+    try:
+        return json.loads(result.stdout).get("items", [])
+    except ValueError:
+        return None
+
+
+def _api_items(path: str, kubectl_args: list, field_selector: str = "") -> list | None:
+    """
+    List via the shared kubectl proxy; fall back to a kubectl call.
+    None when neither could list — an empty namespace is [].
+    """
+    params = {"fieldSelector": field_selector} if field_selector else None
+    data = kube_proxy.get_json(path, params)
+    if data is None:
+        if field_selector:
+            kubectl_args = kubectl_args + [f"--field-selector={field_selector}"]
+        return _kubectl_items(kubectl_args)
+    return data.get("items", [])
+
+
+# Finished Job pods (migrations, create-user) are filtered out by the API
+# server — their Job rows already show completion. A release=airflow label
+# selector would be tighter but also drops the PostgreSQL subchart pod,
+# which only carries app.kubernetes.io/* labels.
+_ACTIVE_PODS = "status.phase!=Succeeded"
+
+
+def _get_pods(namespace: str) -> list | None:
+    """Active pods in the namespace, or None if they couldn't be listed."""
+    items = _api_items(f"/api/v1/namespaces/{namespace}/pods", ["pods", "-n", namespace],
+                       field_selector=_ACTIVE_PODS)
+    return None if items is None else [_pod_from_item(item) for item in items]
 
 
 def _get_jobs(namespace: str) -> list:
-    result = _run(
-        ["kubectl", "get", "jobs", "-n", namespace, "--no-headers",
-         "-o", "custom-columns="
-               "NAME:.metadata.name,"
-               "COMPLETIONS:.status.succeeded,"
-               "STATUS:.status.conditions[0].type"],
-        check=False, capture=True
-    )
     jobs = []
-    for line in result.stdout.splitlines():
-        parts = line.split()
-        if parts:
-            jobs.append({
-                "name":      parts[0],
-                "succeeded": parts[1] if len(parts) > 1 else "0",
-                "condition": parts[2] if len(parts) > 2 else "InProgress",
-            })
+    items = _api_items(f"/apis/batch/v1/namespaces/{namespace}/jobs", ["jobs", "-n", namespace])
+    for item in items or []:
+        status = item.get("status", {})
+        conditions = status.get("conditions") or [{}]
+        jobs.append({
+            "name":      item.get("metadata", {}).get("name", ""),
+            "succeeded": str(status.get("succeeded", "<none>")),
+            "condition": conditions[0].get("type", "<none>"),
+        })
     return jobs
 
 
+def _pod_from_item(item: dict) -> dict:
+    """
+    Map a pod object from kubectl's JSON output to the dict shape used
+    throughout this module (string values, "<none>" for missing fields).
+    """
+    status = item.get("status", {})
+    cs = (status.get("containerStatuses") or [{}])[0]
+    ready = cs.get("ready")
+    return {
+        "name":     item.get("metadata", {}).get("name", ""),
+        "ready":    "<none>" if ready is None else str(ready).lower(),
+        "status":   status.get("phase", "Unknown"),
+        "restarts": str(cs.get("restartCount", "<none>")),
+        "waiting":  cs.get("state", {}).get("waiting", {}).get("reason", "<none>"),
+    }
+
+
+class _PodWatcher:
+    """
+    Keeps an in-memory view of the namespace's pods up to date from one
+    long-lived `kubectl get pods --watch` stream, instead of re-listing
+    every tick. ADDED/MODIFIED events upsert, DELETED removes.
+
+    kubectl replays the current pods as ADDED events whenever the watch
+    (re)connects, and we also re-list every 60s as a reconciliation
+    fallback in case an event was dropped.
+
+    `changed` is set whenever a pod appears, disappears or changes phase
+    or readiness, so the display loop can wake on it instead of sleeping.
+    """
+
+    RELIST_SECONDS = 60
+
+    def __init__(self, namespace: str):
+        self.namespace  = namespace
+        self._pods: dict = {}
+        self._lock      = threading.Lock()
+        self._stopped   = threading.Event()
+        self._proc      = None
+        self._last_list = 0.0
+        self.changed    = threading.Event()
+
+    def __enter__(self):
+        self._relist()
+        threading.Thread(target=self._stream, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stopped.set()
+        if self._proc and self._proc.poll() is None:
+            self._proc.terminate()
+
+    def pods(self) -> list:
+        if time.time() - self._last_list >= self.RELIST_SECONDS:
+            self._relist()
+        with self._lock:
+            return list(self._pods.values())
+
+    def _relist(self):
+        pods = _get_pods(self.namespace)
+        # A failed list keeps the last snapshot (retried next interval)
+        # rather than blanking the display until the watch catches up
+        if pods is not None:
+            with self._lock:
+                self._pods = {p["name"]: p for p in pods}
+        self._last_list = time.time()
+
+    def _apply(self, event: dict):
+        pod = _pod_from_item(event.get("object", {}))
+        with self._lock:
+            old = self._pods.get(pod["name"])
+            if event.get("type") == "DELETED":
+                self._pods.pop(pod["name"], None)
+            elif event.get("type") in ("ADDED", "MODIFIED"):
+                self._pods[pod["name"]] = pod
+            else:
+                return
+        # Ignore updates that don't move the display (e.g. annotations)
+        if old is None or event.get("type") == "DELETED" or \
+                (old["status"], old["ready"]) != (pod["status"], pod["ready"]):
+            self.changed.set()
+
+    def _stream(self):
+        while not self._stopped.is_set():
+            try:
+                self._proc = subprocess.Popen(
+                    [tool_path("kubectl"), "get", "pods", "-n", self.namespace,
+                     f"--field-selector={_ACTIVE_PODS}",
+                     "--watch", "--output-watch-events", "-o", "json"],
+                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+                )
+            except OSError:
+                return  # no kubectl — pods() still re-lists periodically
+
+            # kubectl pretty-prints one JSON object per event; a bare "}"
+            # line closes the top-level object.
+            buf = []
+            for line in self._proc.stdout:
+                buf.append(line)
+                if line.rstrip() == "}":
+                    try:
+                        self._apply(json.loads("".join(buf)))
+                    except ValueError:
+                        pass
+                    buf = []
+            self._proc.wait()
+
+            # Watch dropped (server timeout, API restart) — back off briefly
+            # and reconnect; the replayed ADDED events resync the view.
+            if self._stopped.wait(2):
+                return
+
+
 def _get_pod_pending_reason(namespace: str, pod_name: str) -> str:
     """
     Return a short human-readable reason why a pod is stuck Pending.
@@ -255,9 +430,10 @@ def _get_crash_reason(namespace: str, pod_name: str) -> str:
 
 # ── Live progress table ────────────────────────────────────────────────────────
 
-def _build_progress_table(namespace: str, elapsed: int, pending_reasons: dict) -> Panel:
-    pods = _get_pods(namespace)
-    jobs = _get_jobs(namespace)
+def _build_progress_table(pods: list, jobs: list, elapsed: int, pending_reasons: dict) -> "Panel":
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich import box
 
     table = Table(box=box.SIMPLE, show_header=True, expand=True)
     table.add_column("Component",  style="cyan",  no_wrap=True, min_width=35)
@@ -316,11 +492,8 @@ def _build_progress_table(namespace: str, elapsed: int, pending_reasons: dict) -
     return Panel(table, title=title, border_style="cyan")
 
 
-def _all_ready(namespace: str) -> bool:
+def _all_ready(pods: list, jobs: list) -> bool:
     """Returns True when all pods are Running+Ready and all jobs are Complete."""
-    pods = _get_pods(namespace)
-    jobs = _get_jobs(namespace)
-
     if not pods:
         return False
 
@@ -345,14 +518,13 @@ def _all_ready(namespace: str) -> bool:
     return pods_ok and jobs_ok
 
 
-def _has_fatal_error(namespace: str) -> tuple[bool, str]:
+def _has_fatal_error(namespace: str, pods: list) -> tuple[bool, str]:
     """
     Detect unrecoverable errors early so we can bail out with a useful message
     instead of waiting for the full 20-minute timeout.
 
     Returns (is_fatal, reason_string).
     """
-    pods = _get_pods(namespace)
     for p in pods:
         name   = p["name"]
         status = p["status"]
@@ -373,11 +545,9 @@ def _has_fatal_error(namespace: str) -> tuple[bool, str]:
                 return True, reason
 
         # ImagePullBackOff = won't recover without intervention
+        # (waiting reason comes with the pod listing — no extra kubectl call)
         if status == "Pending":
-            raw = _run(
-                ["kubectl", "get", "pod", name, "-n", namespace, "-o", "jsonpath={.status.containerStatuses[0].state.waiting.reason}"],
-                check=False, capture=True
-            ).stdout.strip()
+            raw = p.get("waiting", "")
             if raw in ("ImagePullBackOff", "ErrImagePull"):
                 return True, f"Pod '{name}': {raw} — Docker Hub pull failed. Check your network connection."
 
@@ -436,21 +606,35 @@ def _print_failure_diagnostics(namespace: str):
 def _watch_airflow(namespace: str, timeout_seconds: int = 1200):
     """
     Live-updating progress display showing every pod and job status.
-    Updates every 5 seconds until everything is ready or timeout.
+    Pod state comes from a watch stream; the display refreshes as soon as
+    a pod transitions, or on an adaptive 1–10 s tick otherwise, until
+    everything is ready or timeout.
     Shows pending reasons and detects fatal errors early.
     """
+    from rich.live import Live
+
     console.print()
     start = time.time()
     pending_reasons: dict = {}   # pod_name → reason string (refreshed every 30s)
     last_reason_refresh = 0
+    last_fatal_check    = 0
+    delay      = 1               # seconds; doubles while nothing changes, max 10
+    prev_state = None
 
-    with Live(console=console, refresh_per_second=0.5, transient=False) as live:
+    with _PodWatcher(namespace) as watcher, \
+         Live(console=console, refresh_per_second=0.5, transient=False) as live:
         while True:
             elapsed = int(time.time() - start)
 
+            # One pods + jobs snapshot per tick, shared by the table, the
+            # readiness check and fatal-error detection below. Clear first
+            # so a transition landing after the snapshot still wakes us.
+            watcher.changed.clear()
+            pods = watcher.pods()
+            jobs = _get_jobs(namespace)
+
             # ── Refresh pending reasons every 30 seconds (expensive kubectl describe) ──
             if elapsed - last_reason_refresh >= 30:
-                pods = _get_pods(namespace)
                 for p in pods:
                     if p["status"] == "Pending":
                         reason = _get_pod_pending_reason(namespace, p["name"])
@@ -470,22 +654,23 @@ def _watch_airflow(namespace: str, timeout_seconds: int = 1200):
                 _print_failure_diagnostics(namespace)
                 sys.exit(1)
 
-            live.update(_build_progress_table(namespace, elapsed, pending_reasons))
+            table = _build_progress_table(pods, jobs, elapsed, pending_reasons)
+            live.update(table)
 
             # ── Success ───────────────────────────────────────────────────────
-            if _all_ready(namespace):
+            if _all_ready(pods, jobs):
                 live.stop()
                 console.print()
                 console.print("[bold green]  ✓  All Airflow services are ready![/bold green]")
                 console.print()
-                final = _build_progress_table(namespace, elapsed, pending_reasons)
-                console.print(final)
+                console.print(table)
                 return
 
             # ── Early fatal error detection ───────────────────────────────────
             # Check every 30s after the first minute (give pods time to start)
-            if elapsed > 60 and elapsed % 30 < 5:
-                is_fatal, reason = _has_fatal_error(namespace)
+            if elapsed > 60 and elapsed - last_fatal_check >= 30:
+                last_fatal_check = elapsed
+                is_fatal, reason = _has_fatal_error(namespace, pods)
                 if is_fatal:
                     live.stop()
                     console.print()
@@ -493,7 +678,13 @@ def _watch_airflow(namespace: str, timeout_seconds: int = 1200):
                     _print_failure_diagnostics(namespace)
                     sys.exit(1)
 
-            time.sleep(5)
+            # ── Adaptive tick: poll fast right after a transition, back off
+            #    while pods are quietly pulling images. A watch event cuts
+            #    the wait short; the timeout still re-polls jobs. ─────────
+            state = tuple(sorted((p["name"], p["status"], p["ready"]) for p in pods))
+            delay = 1 if state != prev_state else min(delay * 2, 10)
+            prev_state = state
+            watcher.changed.wait(timeout=delay)
 
 
 # ── Public API ─────────────────────────────────────────────────────────────────
@@ -604,9 +795,15 @@ def _fix_statefulset_conflict(namespace: str = "airflow"):
 
 
 def _run_helm_install(values_file: Path) -> subprocess.CompletedProcess:
-    """Run the helm upgrade --install command and return the result."""
+    """
+    Run the helm upgrade --install command, echoing its output as it
+    arrives so a slow submit doesn't look like a hang, and return the
+    result. Helm's stdout and stderr are merged, so the returned
+    CompletedProcess carries the full output in both fields — callers
+    match error text in .stderr.
+    """
     cmd = [
-        "helm", "upgrade", "--install", "airflow",
+        tool_path("helm"), "upgrade", "--install", "airflow",
         "apache-airflow/airflow",
         "--version",   AIRFLOW_CHART_VERSION,
         "--namespace", "airflow",
@@ -614,11 +811,18 @@ def _run_helm_install(values_file: Path) -> subprocess.CompletedProcess:
         "--timeout",   "5m",
         # No --wait — we poll progress ourselves
     ]
-    return _run(cmd, check=False, capture=True)
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            text=True, bufsize=1)
+    lines = []
+    for line in proc.stdout:
+        lines.append(line)
+        console.print(f"  {line.rstrip()}", style="dim", markup=False, highlight=False)
+    output = "".join(lines)
+    return subprocess.CompletedProcess(cmd, proc.wait(), stdout=output, stderr=output)
 
 
 def install_airflow(cluster_name: str = "cdp-local"):
-    values_file = _helm_dir() / "values" / "airflow.yaml"
+    values_file = helm_dir() / "values" / "airflow.yaml"
 
     console.print()
     console.print("[bold cyan]Installing Apache Airflow...[/bold cyan]")
@@ -657,8 +861,7 @@ def install_airflow(cluster_name: str = "cdp-local"):
                 if "context deadline exceeded" in stderr2 or "InProgress" in stderr2:
                     console.print("[yellow]  ⚠  Helm returned timeout (resources were still created — continuing to watch)[/yellow]")
                 else:
-                    console.print("[bold red]✗  Helm install failed (even after StatefulSet fix).[/bold red]")
-                    console.print(stderr2 or result2.stdout)
+                    console.print("[bold red]✗  Helm install failed (even after StatefulSet fix) — see Helm output above.[/bold red]")
                     console.print()
                     console.print("  Try a full reset:  [yellow]cdp-dev destroy[/yellow]  then  [yellow]cdp-dev install[/yellow]")
                     sys.exit(1)
@@ -666,8 +869,7 @@ def install_airflow(cluster_name: str = "cdp-local"):
                 console.print("[green]  ✓  Resources submitted.[/green]")
 
         else:
-            console.print("[bold red]✗  Helm install failed.[/bold red]")
-            console.print(stderr or result.stdout)
+            console.print("[bold red]✗  Helm install failed — see Helm output above.[/bold red]")
             sys.exit(1)
     else:
         console.print("[green]  ✓  Resources submitted.[/green]")
@@ -5,14 +5,9 @@ Manages the Kind (Kubernetes in Docker) cluster lifecycle.
 import subprocess
 import sys
 import os
-import platform
-import importlib.resources
-from pathlib import Path
+from functools import lru_cache
 
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-
-console = Console()
+from .utils import IS_WINDOWS, helm_dir, console
 
 CLUSTER_NAME = "cdp-local"
 
@@ -23,56 +18,99 @@ def _run(cmd: list, check: bool = True, capture: bool = False, input_text: str =
         cmd,
         check=check,
         capture_output=capture,
-        text=True,
+        text=capture or input_text is not None,  # nothing to decode otherwise
         input=input_text,
+        # Python's own handles are non-inheritable anyway; skipping the
+        # handle-list setup makes each spawn cheaper on Windows
+        close_fds=not IS_WINDOWS,
     )
 
 
-def _helm_config_path() -> Path:
+def _run_streaming(cmd: list, on_line) -> subprocess.CompletedProcess:
     """
-    Resolve the helm/ directory whether the package is installed
-    (importlib.resources) or running from a local editable install (src layout).
+    Run a command, handing each line of combined stdout/stderr to
+    on_line as it arrives. Draining continuously means a chatty command
+    can never block on a full pipe. Raises CalledProcessError on failure,
+    like _run(check=True).
     """
-    try:
-        # Installed via pip — files live inside the package
-        with importlib.resources.path("cdp_dev", "__init__.py") as p:
-            candidate = p.parent.parent / "helm"
-            if candidate.exists():
-                return candidate
-    except Exception:
-        pass
-
-    # Editable install or running from repo root
-    here = Path(__file__).parent.parent
-    candidate = here / "helm"
-    if candidate.exists():
-        return candidate
-
-    raise FileNotFoundError(
-        "Cannot locate helm/ directory. "
-        "Make sure you installed the package correctly: "
-        "pip install git+https://github.com/<org>/cdp-local-dev.git"
-    )
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            text=True, bufsize=1)
+    lines = []
+    for line in proc.stdout:
+        lines.append(line)
+        on_line(line)
+    output = "".join(lines)
+    if proc.wait() != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, output=output)
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout=output)
 
 
-def cluster_exists() -> bool:
+_docker_client = None   # docker SDK client, False once it's known to be unusable
+
+
+def _containers_via_sdk() -> dict | None:
+    """
+    Same query as _cluster_containers over the Docker API socket, when
+    the optional `docker` package is installed — no docker CLI process.
+    None means "use the CLI instead".
+    """
+    global _docker_client
+    if _docker_client is False:
+        return None
     try:
-        result = _run(["kind", "get", "clusters"], capture=True, check=False)
-        return CLUSTER_NAME in result.stdout.splitlines()
+        if _docker_client is None:
+            import docker
+            _docker_client = docker.from_env()
+        found = _docker_client.containers.list(
+            all=True, filters={"label": f"io.x-k8s.kind.cluster={CLUSTER_NAME}"}
+        )
     except Exception:
-        return False
+        _docker_client = False   # not installed, or no daemon socket
+        return None
+    return {c.name: c.status for c in found}
 
 
-def cluster_running() -> bool:
-    """Check if the Kind Docker container is actually running (not paused/stopped)."""
+def _cluster_containers() -> dict:
+    """
+    {container name: state} for every node container of our cluster, from
+    one `docker ps`. kind labels its nodes with the cluster name, which is
+    also how `kind get clusters` finds them.
+    """
+    containers = _containers_via_sdk()
+    if containers is not None:
+        return containers
     try:
         result = _run(
-            ["docker", "inspect", "--format", "{{.State.Running}}", f"{CLUSTER_NAME}-control-plane"],
+            ["docker", "ps", "-a",
+             "--filter", f"label=io.x-k8s.kind.cluster={CLUSTER_NAME}",
+             "--format", "{{.Names}}\t{{.State}}"],
             capture=True, check=False
         )
-        return result.stdout.strip() == "true"
     except Exception:
-        return False
+        return {}
+    if result.returncode != 0:
+        return {}
+    return dict(line.split("\t", 1) for line in result.stdout.splitlines() if "\t" in line)
+
+
+@lru_cache(maxsize=1)
+def cluster_state() -> tuple:
+    """
+    (exists, running) for the cluster from a single Docker query, cached
+    for the rest of the command — the create/delete/start/stop helpers
+    below clear it after changing either answer.
+    """
+    containers = _cluster_containers()
+    return bool(containers), containers.get(f"{CLUSTER_NAME}-control-plane") == "running"
+
+
+def cluster_exists() -> bool:
+    return cluster_state()[0]
+
+
+def cluster_running() -> bool:
+    """Check if the Kind Docker container is actually running (not paused/stopped)."""
+    return cluster_state()[1]
 
 
 def create_cluster():
@@ -81,11 +119,11 @@ def create_cluster():
         console.print(f"[yellow]⚠  Cluster '[bold]{CLUSTER_NAME}[/bold]' already exists — skipping create.[/yellow]")
         return
 
-    # Prefer repo layout; fall back to installed-package layout
-    base = Path(__file__).parent
-    kind_config = base / "helm" / "kind" / "kind-config.yaml"
-    if not kind_config.exists():
-        kind_config = _helm_config_path() / "kind" / "kind-config.yaml"
+    try:
+        kind_config = helm_dir() / "kind" / "kind-config.yaml"
+    except FileNotFoundError as e:
+        console.print(f"[red]  ✗  {e}[/red]")
+        sys.exit(1)
 
     if not kind_config.exists():
         console.print(f"[red]  ✗  kind-config.yaml not found at {kind_config}[/red]")
@@ -93,10 +131,28 @@ def create_cluster():
 
     console.print(f"[cyan]  Using Kind config:[/cyan] {kind_config}")
 
+    from rich.markup import escape
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    base = "Creating Kind cluster (this takes ~60 seconds)..."
     with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"),
-                  transient=True) as progress:
-        progress.add_task("Creating Kind cluster (this takes ~60 seconds)...", total=None)
-        _run(["kind", "create", "cluster", "--config", str(kind_config), "--name", CLUSTER_NAME])
+                  console=console, transient=True) as progress:
+        task = progress.add_task(base, total=None)
+
+        def on_line(line: str):
+            # Show kind's current step (e.g. "Ensuring node image") next to the spinner
+            step = line.strip().lstrip("✓•✗ ").strip()
+            if step:
+                progress.update(task, description=f"{base} [dim]{escape(step)}[/dim]")
+
+        try:
+            _run_streaming(["kind", "create", "cluster", "--config", str(kind_config),
+                            "--name", CLUSTER_NAME], on_line)
+        except subprocess.CalledProcessError as e:
+            progress.stop()
+            console.print(e.output, markup=False, highlight=False)
+            raise
+        finally:
+            cluster_state.cache_clear()
 
     console.print(f"[green]  ✓  Kind cluster '[bold]{CLUSTER_NAME}[/bold]' created.[/green]")
 
@@ -106,22 +162,29 @@ def delete_cluster():
     if not cluster_exists():
         console.print(f"[yellow]  Cluster '{CLUSTER_NAME}' does not exist.[/yellow]")
         return
-    _run(["kind", "delete", "cluster", "--name", CLUSTER_NAME])
+    try:
+        _run(["kind", "delete", "cluster", "--name", CLUSTER_NAME])
+    finally:
+        cluster_state.cache_clear()
     console.print(f"[green]  ✓  Cluster '{CLUSTER_NAME}' deleted.[/green]")
 
 
 def start_cluster():
     """Resume a stopped Kind cluster by starting its Docker containers."""
-    if not cluster_exists():
+    exists, running = cluster_state()
+    if not exists:
         console.print("[red]  ✗  Cluster does not exist. Run [bold]cdp-dev install[/bold] first.[/red]")
         sys.exit(1)
 
-    if cluster_running():
+    if running:
         console.print(f"[green]  ✓  Cluster '{CLUSTER_NAME}' is already running.[/green]")
         return
 
     console.print(f"[cyan]  Starting Kind cluster containers...[/cyan]")
-    _run(["docker", "start", f"{CLUSTER_NAME}-control-plane"])
+    try:
+        _run(["docker", "start", f"{CLUSTER_NAME}-control-plane"])
+    finally:
+        cluster_state.cache_clear()
     console.print(f"[green]  ✓  Cluster '{CLUSTER_NAME}' started.[/green]")
 
 
@@ -133,6 +196,7 @@ def stop_cluster():
 
     console.print(f"[cyan]  Stopping Kind cluster containers (your data is preserved)...[/cyan]")
     _run(["docker", "stop", f"{CLUSTER_NAME}-control-plane"], check=False)
+    cluster_state.cache_clear()
     console.print(f"[green]  ✓  Cluster '{CLUSTER_NAME}' stopped.[/green]")
 
 
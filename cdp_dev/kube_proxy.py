@@ -0,0 +1,100 @@
+"""
+kube_proxy.py
+One background `kubectl proxy` per process, so the dozens of API reads
+made while watching an install skip kubectl's per-call startup,
+kubeconfig parsing and TLS handshake.
+
+The proxy is started lazily on first use and killed at exit. Every
+helper returns None when the proxy is unavailable so callers can fall
+back to plain kubectl.
+"""
+import atexit
+import re
+import subprocess
+import threading
+
+from .utils import tool_path
+
+_proc     = None
+_base_url = None
+_session  = None
+_failed   = False
+_lock     = threading.Lock()
+
+_SERVING_RE = re.compile(r"127\.0\.0\.1:(\d+)")
+
+
+def base_url() -> str | None:
+    """Start the proxy if needed and return its URL (None if it can't start)."""
+    global _proc, _base_url, _failed
+    with _lock:
+        if _base_url or _failed:
+            return _base_url
+
+        try:
+            _proc = subprocess.Popen(
+                [tool_path("kubectl"), "proxy", "--port=0"],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+            )
+        except OSError:
+            _failed = True
+            return None
+        atexit.register(stop)
+
+        # kubectl prints "Starting to serve on 127.0.0.1:<port>" once bound.
+        # Read it on a helper thread so a wedged kubectl can't hang us.
+        first_line: list = []
+        reader = threading.Thread(
+            target=lambda: first_line.append(_proc.stdout.readline()), daemon=True
+        )
+        reader.start()
+        reader.join(10)
+
+        m = _SERVING_RE.search(first_line[0]) if first_line else None
+        if not m:
+            _failed = True
+            stop()
+            return None
+
+        _base_url = f"http://127.0.0.1:{m.group(1)}"
+        return _base_url
+
+
+def _get(path: str, params: dict | None = None, **kwargs):
+    global _session
+    url = base_url()
+    if url is None:
+        return None
+
+    import requests
+    if _session is None:
+        _session = requests.Session()   # keep-alive across every poll
+    try:
+        return _session.get(url + path, params=params, timeout=10, **kwargs)
+    except requests.RequestException:
+        return None
+
+
+def get_json(path: str, params: dict | None = None) -> dict | None:
+    """GET an API path and decode it; None on any failure (incl. non-2xx)."""
+    resp = _get(path, params)
+    if resp is None or not resp.ok:
+        return None
+    try:
+        return resp.json()
+    except ValueError:
+        return None
+
+
+def status_code(path: str) -> int | None:
+    """HTTP status for an API path (e.g. 404 for a missing object), None if unreachable."""
+    resp = _get(path)
+    return None if resp is None else resp.status_code
+
+
+def stop():
+    """Terminate the proxy process. Safe to call more than once."""
+    global _proc, _base_url
+    if _proc is not None and _proc.poll() is None:
+        _proc.terminate()
+    _proc, _base_url = None, None
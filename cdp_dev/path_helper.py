@@ -9,59 +9,118 @@ macOS/Linux strategy: add Scripts dir to shell rc file.
 """
 import os
 import sys
-import site
-import platform
+import json
+import locale
+import functools
 import sysconfig
-import ctypes
 from pathlib import Path
 
-from .utils import is_admin_windows
+from . import __version__
+from .utils import IS_WINDOWS, IS_MAC, is_admin_windows, console
+
+# Written once setup is confirmed. Records which interpreter, exe and
+# cdp-dev version it was confirmed for; any mismatch re-runs the checks.
+_INSTALL_STAMP = Path.home() / ".cdp-dev" / "install-stamp.json"
+
+_SCRIPTS_DIR = Path(sysconfig.get_path("scripts"))
 
 
 # ── Find where pip installed cdp-dev ─────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
 def find_cdpdev_exe() -> Path | None:
     """Locate cdp-dev.exe/.sh regardless of Python installation type."""
-    exe_name = "cdp-dev.exe" if platform.system() == "Windows" else "cdp-dev"
+    exe_name = "cdp-dev.exe" if IS_WINDOWS else "cdp-dev"
+
+    # Common case first — skips the Microsoft Store Packages scan entirely
+    primary = os.path.join(_SCRIPTS_DIR, exe_name)
+    if _exists(primary):
+        return Path(primary)
+
     for d in _candidate_dirs():
-        exe = d / exe_name
-        if exe.exists():
-            return exe
+        exe = os.path.join(d, exe_name)
+        if _exists(exe):
+            return Path(exe)
     return None
 
 
-def _candidate_dirs() -> list:
-    dirs = []
+def _exists(path: str) -> bool:
+    """Bare os.stat probe — skips the Path object and wrapper overhead of Path.exists()."""
+    try:
+        os.stat(path)
+        return True
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _candidate_dirs() -> tuple:
+    # Keyed on the normalized path so the same directory reached twice
+    # (e.g. user base == sysconfig scripts, or differing case on Windows)
+    # is only probed once; dicts keep the most-likely-first order.
+    seen = {}
+
+    def _add(p: Path):
+        seen.setdefault(os.path.normcase(os.path.normpath(str(p))), p)
 
     # Standard pip scripts location
-    dirs.append(Path(sysconfig.get_path("scripts")))
+    _add(_SCRIPTS_DIR)
 
     # pip --user install location
+    import site
     if hasattr(site, "getuserbase"):
         base = Path(site.getuserbase())
-        dirs.append(base / ("Scripts" if platform.system() == "Windows" else "bin"))
+        _add(base / ("Scripts" if IS_WINDOWS else "bin"))
 
     # Microsoft Store Python: scan all versions under Packages
-    if platform.system() == "Windows":
+    if IS_WINDOWS:
         packages = Path.home() / "AppData" / "Local" / "Packages"
-        if packages.exists():
-            for pkg in sorted(packages.glob("PythonSoftwareFoundation.Python.*"), reverse=True):
-                local = pkg / "LocalCache" / "local-packages"
-                if local.exists():
-                    for py_ver in sorted(local.glob("Python*"), reverse=True):
-                        dirs.append(py_ver / "Scripts")
+        for pkg in _scan_prefix(packages, "PythonSoftwareFoundation.Python."):
+            for py_ver in _scan_prefix(pkg / "LocalCache" / "local-packages", "Python"):
+                _add(py_ver / "Scripts")
 
-    return dirs
+    return tuple(seen.values())
+
+
+def _scan_prefix(root: Path, prefix: str) -> list:
+    """
+    Subdirectories of root whose name starts with prefix, highest name first.
+    One scandir per level; the dirent type answers is_dir() without a stat.
+    """
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return []
+    with it:
+        entries = [e for e in it if e.name.startswith(prefix) and e.is_dir(follow_symlinks=False)]
+    entries.sort(key=lambda e: e.name, reverse=True)
+    return [Path(e.path) for e in entries]
 
 
 def get_scripts_dir() -> Path:
     exe = find_cdpdev_exe()
-    return exe.parent if exe else Path(sysconfig.get_path("scripts"))
+    return exe.parent if exe else _SCRIPTS_DIR
 
 
 def is_cdpdev_on_path() -> bool:
-    import shutil
-    return shutil.which("cdp-dev") is not None
+    return _on_path(os.environ.get("PATH", ""))
+
+
+@functools.lru_cache(maxsize=4)
+def _on_path(path_env: str) -> bool:
+    """
+    Keyed on the PATH string, so a PATH change is a natural cache miss.
+    We know the exact file names, so skip shutil.which's PATHEXT loop.
+    """
+    names = ("cdp-dev.exe", "cdp-dev.bat") if IS_WINDOWS else ("cdp-dev",)
+    for d in path_env.split(os.pathsep):
+        if not d:
+            continue
+        for name in names:
+            exe = os.path.join(d, name)
+            if os.path.isfile(exe) and (IS_WINDOWS or os.access(exe, os.X_OK)):
+                return True
+    return False
 
 
 # ── Windows: System32 .bat wrapper ───────────────────────────────────────────
@@ -72,23 +131,23 @@ def _bat_path() -> Path:
 
 
 def _bat_is_current(cdp_exe: Path) -> bool:
-    bat = _bat_path()
-    if not bat.exists():
+    try:
+        content = _bat_path().read_text()
+    except OSError:
         return False
-    return str(cdp_exe) in bat.read_text()
+    # Windows paths compare case-insensitively
+    return str(cdp_exe).lower() in content.lower()
 
 
 def _install_bat_as_admin(cdp_exe: Path):
     """Relaunch current process with UAC to write the .bat file."""
-    from rich.console import Console
-    console = Console()
     console.print()
     console.print("[bold yellow]  One-time setup: installing cdp-dev system-wide...[/bold yellow]")
     console.print("  Windows will show a permission prompt — click [bold]Yes[/bold].")
     console.print()
 
     # Pass a special flag so the elevated process knows to just install bat and exit
-    import subprocess
+    import ctypes
     script = (
         f"import sys; sys.path.insert(0, r'{Path(__file__).parent.parent}'); "
         f"from cdp_dev.path_helper import _write_bat; "
@@ -108,22 +167,52 @@ def _install_bat_as_admin(cdp_exe: Path):
 def _write_bat(cdp_exe_path: str):
     """Write the .bat file. Called in elevated process."""
     bat = Path(os.environ.get("SystemRoot", r"C:\Windows")) / "System32" / "cdp-dev.bat"
-    bat.write_text(f'@echo off\n"{cdp_exe_path}" %*\n')
+    data = f'@echo off\r\n"{cdp_exe_path}" %*\r\n'.encode(locale.getpreferredencoding(False))
+    fd = os.open(str(bat), os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    _on_path.cache_clear()  # the wrapper doesn't change PATH, but does change the answer
 
 
-def _install_bat_windows(cdp_exe: Path):
-    """Install cdp-dev.bat into System32 (with UAC if needed)."""
+def _install_bat_windows(cdp_exe: Path) -> bool:
+    """
+    Install cdp-dev.bat into System32 (with UAC if needed).
+    Returns True only when the wrapper is known to be in place — the
+    elevated child runs detached, so its outcome is checked next run.
+    """
     if _bat_is_current(cdp_exe):
-        return  # already installed and pointing to right exe
+        return True  # already installed and pointing to right exe
 
     if is_admin_windows():
         _write_bat(str(cdp_exe))
-    else:
-        _install_bat_as_admin(cdp_exe)
+        return True
+
+    _install_bat_as_admin(cdp_exe)
+    return False
 
 
 # ── macOS / Linux: shell rc file ─────────────────────────────────────────────
 
+def _rc_has(rc: Path, text: str) -> bool:
+    """Substring check on the raw bytes — no decode of the whole rc file."""
+    try:
+        with open(rc, "rb") as f:
+            return os.fsencode(text) in f.read()
+    except OSError:
+        return False
+
+
+def _rc_append(rc: Path, text: str):
+    """Append in a single write (creates the rc file if missing)."""
+    fd = os.open(rc, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, os.fsencode(text))
+    finally:
+        os.close(fd)
+
+
 def _fix_unix(scripts_dir: Path):
     scripts_str = str(scripts_dir)
     if scripts_str in os.environ.get("PATH", ""):
@@ -135,23 +224,61 @@ def _fix_unix(scripts_dir: Path):
     if "zsh" in shell:
         rc = home / ".zshrc"
     elif "bash" in shell:
-        rc = home / ".bash_profile" if platform.system() == "Darwin" else home / ".bashrc"
+        rc = home / ".bash_profile" if IS_MAC else home / ".bashrc"
     else:
         rc = home / ".profile"
 
-    content = rc.read_text() if rc.exists() else ""
-    if scripts_str not in content:
-        with open(rc, "a") as f:
-            f.write(f"\n# cdp-local-dev\nexport PATH=\"{scripts_str}:$PATH\"\n")
+    if not _rc_has(rc, scripts_str):
+        _rc_append(rc, f"\n# cdp-local-dev\nexport PATH=\"{scripts_str}:$PATH\"\n")
 
     # Fix current session
     os.environ["PATH"] = scripts_str + ":" + os.environ.get("PATH", "")
+    _on_path.cache_clear()
 
 
 # ── Main public function ──────────────────────────────────────────────────────
 
 _already_run = False
 
+
+def _interpreter_mtime() -> float | None:
+    try:
+        return os.stat(sys.executable).st_mtime
+    except OSError:
+        return None
+
+
+def _stamp() -> dict:
+    """What a confirmed setup looks like for this interpreter and version."""
+    return {
+        "version":      __version__,
+        "python":       sys.executable,
+        "python_mtime": _interpreter_mtime(),
+    }
+
+
+def _stamp_is_current() -> bool:
+    try:
+        saved = json.loads(_INSTALL_STAMP.read_text())
+    except (OSError, ValueError):
+        return False
+    if any(saved.get(k) != v for k, v in _stamp().items()):
+        return False  # upgraded cdp-dev, or a different / rebuilt Python
+    if IS_WINDOWS:
+        # Someone may have deleted or overwritten the wrapper since
+        exe = saved.get("cdp_exe")
+        return bool(exe) and _bat_is_current(Path(exe))
+    return True
+
+
+def _save_stamp(cdp_exe: Path):
+    try:
+        _INSTALL_STAMP.parent.mkdir(parents=True, exist_ok=True)
+        _INSTALL_STAMP.write_text(json.dumps({**_stamp(), "cdp_exe": str(cdp_exe)}, indent=2))
+    except OSError:
+        pass  # best effort — we simply re-check next time
+
+
 def ensure_cdpdev_globally_accessible():
     """
     Called automatically on every CLI invocation.
@@ -164,14 +291,23 @@ def ensure_cdpdev_globally_accessible():
         return
     _already_run = True
 
+    # Fast path: a previous run already finished setup for this
+    # interpreter and version — skip the exe search entirely
+    if _stamp_is_current():
+        return
+
     cdp_exe = find_cdpdev_exe()
     if cdp_exe is None:
         return  # package not properly installed, skip
 
-    if platform.system() == "Windows":
-        _install_bat_windows(cdp_exe)
+    if IS_WINDOWS:
+        done = _install_bat_windows(cdp_exe)
     else:
         _fix_unix(cdp_exe.parent)
+        done = True
+
+    if done:
+        _save_stamp(cdp_exe)
 
 
 def ensure_on_path():
@@ -8,13 +8,12 @@ file (~/.cdp-dev/port-forwards.json) and restart them on cdp-dev start.
 """
 import json
 import os
+import socket
 import subprocess
 import time
 from pathlib import Path
 
-from rich.console import Console
-
-console = Console()
+from .utils import IS_WINDOWS, console, tool_path
 
 STATE_DIR  = Path.home() / ".cdp-dev"
 STATE_FILE = STATE_DIR / "port-forwards.json"
@@ -31,23 +30,40 @@ FORWARDS = [
 ]
 
 
+_on_disk = None   # bytes last read from / written to STATE_FILE this process
+
+
 def _state() -> dict:
-    if STATE_FILE.exists():
-        try:
-            return json.loads(STATE_FILE.read_text())
-        except Exception:
-            return {}
-    return {}
+    global _on_disk
+    try:
+        raw = STATE_FILE.read_bytes()
+    except OSError:
+        return {}
+    _on_disk = raw
+    try:
+        return json.loads(raw)
+    except Exception:
+        return {}
 
 
 def _save_state(data: dict):
+    """
+    Write the state file only when its content changes, via a temp file +
+    rename so a crash mid-write can't leave it truncated.
+    """
+    global _on_disk
+    new = json.dumps(data, indent=2).encode()
+    if new == _on_disk:
+        return
     STATE_DIR.mkdir(parents=True, exist_ok=True)
-    STATE_FILE.write_text(json.dumps(data, indent=2))
+    tmp = STATE_FILE.with_suffix(".json.tmp")
+    tmp.write_bytes(new)
+    os.replace(tmp, STATE_FILE)
+    _on_disk = new
 
 
 def _pid_alive(pid: int) -> bool:
-    import platform
-    if platform.system() == "Windows":
+    if IS_WINDOWS:
         try:
             import ctypes
             handle = ctypes.windll.kernel32.OpenProcess(1, False, pid)
@@ -66,27 +82,84 @@ def _pid_alive(pid: int) -> bool:
         return False
 
 
+def _alive_snapshot(pids) -> set | None:
+    """
+    Every live PID from one system-wide listing, so checking several
+    tracked forwards costs one call instead of a probe each. Returns
+    None (callers fall back to _pid_alive) for fewer than two PIDs —
+    one probe is cheaper than a listing — or when there's no cheap way
+    to list processes: psutil if installed, else /proc on Linux.
+    """
+    if len(pids) < 2:
+        return None
+    try:
+        import psutil
+        return set(psutil.pids())
+    except ImportError:
+        pass
+    try:
+        return {int(d) for d in os.listdir("/proc") if d.isdigit()}
+    except OSError:
+        return None
+
+
+def _is_alive(pid: int, alive: set | None) -> bool:
+    return _pid_alive(pid) if alive is None else pid in alive
+
+
+def _wait_port_ready(port: int, timeout: float = 3.0) -> bool:
+    """Poll until something accepts connections on localhost:port."""
+    deadline = time.time() + timeout
+    delay = 0.02
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return True
+        except OSError:
+            pass
+        if time.time() >= deadline:
+            return False
+        time.sleep(delay)
+        delay = min(delay * 2, 0.2)
+
+
 def start_all():
     """Start all port-forwards in the background."""
     state = _state()
+    alive = _alive_snapshot([state[f["name"]] for f in FORWARDS if state.get(f["name"])])
+
+    # Spawn every forward first, then wait for them: the binds happen in
+    # parallel, so N forwards take about as long as the slowest one.
+    launched = []
     for fwd in FORWARDS:
         name = fwd["name"]
         existing_pid = state.get(name)
-        if existing_pid and _pid_alive(existing_pid):
+        if existing_pid and _is_alive(existing_pid, alive):
             console.print(f"[yellow]  ⚠  Port-forward '{name}' already running (PID {existing_pid}).[/yellow]")
             continue
 
-        proc = subprocess.Popen(
+        launched.append((fwd, subprocess.Popen(
             [
-                "kubectl", "port-forward",
+                tool_path("kubectl"), "port-forward",
                 fwd["service"],
                 f"{fwd['local_port']}:{fwd['remote_port']}",
                 "-n", fwd["namespace"],
             ],
+            stdin=subprocess.DEVNULL,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
-        )
-        time.sleep(1)  # give it a moment to bind
+            close_fds=not IS_WINDOWS,
+            # Own process group, so a Ctrl+C in this terminal doesn't take
+            # the background forward down with it
+            creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if IS_WINDOWS else 0,
+        )))
+
+    for fwd, proc in launched:
+        name = fwd["name"]
+        # Returns as soon as the forward is listening, instead of a fixed wait
+        if not _wait_port_ready(fwd["local_port"]) and proc.poll() is not None:
+            console.print(f"[red]  ✗  Port-forward '{name}' exited (rc={proc.returncode}).[/red]")
+            continue
         state[name] = proc.pid
         console.print(
             f"[green]  ✓  {name}[/green] → "
@@ -100,8 +173,9 @@ def start_all():
 def stop_all():
     """Kill all tracked port-forward processes."""
     state = _state()
+    alive = _alive_snapshot(list(state.values()))
     for name, pid in state.items():
-        if _pid_alive(pid):
+        if _is_alive(pid, alive):
             try:
                 os.kill(pid, 15)  # SIGTERM
                 console.print(f"[green]  ✓  Stopped port-forward '{name}' (PID {pid}).[/green]")
@@ -110,18 +184,26 @@ def stop_all():
     _save_state({})
 
 
+def _probe_one(fwd: dict, state: dict, alive: set | None = None) -> dict:
+    pid = state.get(fwd["name"])
+    return {
+        "name":       fwd["name"],
+        "url":        fwd["url"],
+        "local_port": fwd["local_port"],
+        "pid":        pid,
+        "alive":      pid is not None and _is_alive(pid, alive),
+    }
+
+
 def status() -> list:
     """Return list of dicts with current port-forward status."""
-    state   = _state()
-    results = []
-    for fwd in FORWARDS:
-        pid   = state.get(fwd["name"])
-        alive = pid is not None and _pid_alive(pid)
-        results.append({
-            "name":       fwd["name"],
-            "url":        fwd["url"],
-            "local_port": fwd["local_port"],
-            "pid":        pid,
-            "alive":      alive,
-        })
-    return results
+    state = _state()
+    alive = _alive_snapshot([state[f["name"]] for f in FORWARDS if state.get(f["name"])])
+    if alive is not None or len(FORWARDS) < 2:
+        # Set lookups, or a single liveness check — not worth a thread pool
+        return [_probe_one(fwd, state, alive) for fwd in FORWARDS]
+
+    # Probe concurrently so status costs the slowest check, not the sum
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=len(FORWARDS)) as ex:
+        return list(ex.map(lambda fwd: _probe_one(fwd, state), FORWARDS))
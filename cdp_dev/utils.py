@@ -1,14 +1,90 @@
-import platform
-import ctypes
+import shutil
+import sys
+from functools import lru_cache
+from pathlib import Path
 
-IS_WINDOWS = platform.system() == "Windows"
-IS_MAC = platform.system() == "Darwin"
-IS_LINUX = platform.system() == "Linux"
+# sys.platform is a compile-time constant; platform.system() goes through uname()
+IS_WINDOWS = sys.platform == "win32"
+IS_MAC = sys.platform == "darwin"
+IS_LINUX = sys.platform.startswith("linux")
 
 
+@lru_cache(maxsize=1)
 def is_admin_windows() -> bool:
-    """Check if the current user has administrator privileges on Windows."""
+    """
+    Check if the current user has administrator privileges on Windows.
+    Cached: a process's token can't gain or lose elevation while it runs.
+    """
     try:
+        import ctypes
         return ctypes.windll.shell32.IsUserAnAdmin() != 0
     except Exception:
         return False
+
+
+@lru_cache(maxsize=1)
+def helm_dir() -> Path:
+    """
+    Locate the bundled helm/ directory (Kind config + chart values).
+    Installed packages ship it inside cdp_dev/; a repo checkout also has
+    a top-level copy next to the package.
+    """
+    pkg = Path(__file__).parent / "helm"
+    if pkg.exists():
+        return pkg
+    repo = Path(__file__).parent.parent / "helm"
+    if repo.exists():
+        return repo
+    raise FileNotFoundError(
+        "Cannot locate helm/ directory. Reinstall cdp-local-dev: "
+        "pip install git+https://github.com/mrjoshuasamuel/cdp-local-dev.git"
+    )
+
+
+_TOOL_PATHS: dict = {}
+
+
+def tool_path(name: str) -> str:
+    """
+    Absolute path of a CLI tool on PATH, resolved once per process so
+    repeated subprocess calls skip the PATH (and PATHEXT) walk.
+    Misses aren't cached — preflight may install the tool later in the
+    same run — and fall back to the bare name.
+    """
+    path = _TOOL_PATHS.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is None:
+            return name
+        _TOOL_PATHS[name] = path
+    return path
+
+
+class _LazyConsole:
+    """
+    Stand-in for a shared rich Console that only imports rich (and
+    builds the Console) the first time something is printed, so
+    importing a module that *might* print costs nothing.
+    """
+
+    _console = None
+
+    @staticmethod
+    def _real():
+        if _LazyConsole._console is None:
+            from rich.console import Console
+            _LazyConsole._console = Console()
+        return _LazyConsole._console
+
+    def __getattr__(self, name):
+        return getattr(self._real(), name)
+
+    # Dunders bypass __getattr__; rich's Live does `with console:` on stop
+    def __enter__(self):
+        return self._real().__enter__()
+
+    def __exit__(self, *exc):
+        return self._real().__exit__(*exc)
+
+
+console = _LazyConsole()
@@ -0,0 +1,84 @@
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from cdp_dev import helm_manager
+
+
+def _pod(name, status="Running", ready="true"):
+    return {"name": name, "status": status, "ready": ready,
+            "restarts": "0", "waiting": "<none>"}
+
+
+READY_PODS = [_pod(n) for n in (
+    "airflow-webserver-0", "airflow-scheduler-0",
+    "airflow-triggerer-0", "airflow-postgresql-0",
+)]
+
+
+class WatchAirflowTest(unittest.TestCase):
+    """Drives the Live display through the shared lazy console."""
+
+    def setUp(self):
+        patches = [
+            mock.patch.object(helm_manager, "_get_jobs", return_value=[]),
+            mock.patch.object(helm_manager._PodWatcher, "_stream", lambda self: None),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_returns_once_everything_is_ready(self):
+        with mock.patch.object(helm_manager, "_get_pods", return_value=READY_PODS):
+            helm_manager._watch_airflow("airflow")
+
+    def test_timeout_stops_display_and_exits(self):
+        with mock.patch.object(helm_manager, "_get_pods", return_value=[]), \
+             mock.patch.object(helm_manager, "_print_failure_diagnostics"), \
+             self.assertRaises(SystemExit):
+            helm_manager._watch_airflow("airflow", timeout_seconds=-1)
+
+
+class PodWatcherRelistTest(unittest.TestCase):
+
+    def test_failed_relist_keeps_last_snapshot(self):
+        watcher = helm_manager._PodWatcher("airflow")
+        with mock.patch.object(helm_manager, "_get_pods", return_value=READY_PODS):
+            watcher._relist()
+        with mock.patch.object(helm_manager, "_get_pods", return_value=None):
+            watcher._relist()
+        self.assertEqual(len(watcher.pods()), len(READY_PODS))
+        self.assertFalse(watcher.changed.is_set())
+
+    def test_failed_kubectl_list_is_none_not_empty(self):
+        failed = subprocess.CompletedProcess([], 1, stdout="", stderr="refused")
+        with mock.patch.object(helm_manager.kube_proxy, "get_json", return_value=None), \
+             mock.patch.object(helm_manager, "_run", return_value=failed):
+            self.assertIsNone(helm_manager._get_pods("airflow"))
+
+
+class RepoUpdateTest(unittest.TestCase):
+
+    def test_result_reaches_add_repos(self):
+        with mock.patch.object(helm_manager, "_update_repos", return_value=""), \
+             mock.patch.object(helm_manager, "console", mock.MagicMock()):
+            helm_manager.add_repos(pending=helm_manager.start_repo_update())
+
+    def test_pending_update_does_not_block_exit(self):
+        # A failed create_cluster exits while the update is still running
+        script = (
+            "import sys, time\n"
+            "from cdp_dev import helm_manager\n"
+            "helm_manager._update_repos = lambda: time.sleep(60) or ''\n"
+            "helm_manager.start_repo_update()\n"
+            "sys.exit(1)\n"
+        )
+        proc = subprocess.run([sys.executable, "-c", script], timeout=20,
+                              cwd=Path(__file__).resolve().parents[1])
+        self.assertEqual(proc.returncode, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import os
+import stat
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from cdp_dev import preflight
+
+
+@unittest.skipIf(preflight.IS_WINDOWS, "POSIX shell script stands in for the tool")
+class _FakeToolTest(unittest.TestCase):
+    """A temp dir as the whole PATH, with `kind` as the only tool."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.bin = self.tmp / "bin"
+        self.bin.mkdir()
+        patches = [
+            mock.patch.object(preflight, "CACHE_FILE", self.tmp / "cache.json"),
+            mock.patch.object(preflight, "console", mock.MagicMock()),
+            mock.patch.object(preflight, "_wait_for_docker", lambda: None),
+            mock.patch.object(preflight, "TOOLS", {"kind": {
+                "min_version": (0, 23),
+                "version_cmd": ["kind", "version"],
+            }}),
+            mock.patch.dict(os.environ, {"PATH": str(self.bin)}),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        preflight._path_index.cache_clear()
+        preflight._check_tool.cache_clear()
+        self.addCleanup(preflight._path_index.cache_clear)
+        self.addCleanup(preflight._check_tool.cache_clear)
+
+    def _install(self, name, spec):
+        tool = self.bin / name
+        tool.write_text("#!/bin/sh\necho 'kind v0.23.0 go1.22 linux/amd64'\n")
+        tool.chmod(tool.stat().st_mode | stat.S_IXUSR)
+        return tool
+
+
+class RecheckAfterInstallTest(_FakeToolTest):
+
+    def test_recheck_finds_binary_installed_into_unchanged_path(self):
+        with mock.patch.object(preflight, "_auto_install", side_effect=self._install):
+            checked = preflight._check_and_install_tools()
+        self.assertTrue(checked["kind"].ok)
+
+
+class RecentPassTest(_FakeToolTest):
+
+    def _save_pass(self):
+        preflight._save_cache(preflight._PASS_KEY, {
+            "at":    time.time(),
+            "path":  os.environ["PATH"],
+            "tools": {"kind": {"version": "0.23", **preflight._binary_stamps()["kind"]}},
+        })
+
+    def test_untouched_binary_is_trusted(self):
+        self._install("kind", {})
+        self._save_pass()
+        # Answered from one PATH index scan, not a which() walk per tool
+        with mock.patch.object(preflight.shutil, "which", side_effect=AssertionError):
+            self.assertEqual(preflight._recent_pass()["kind"].version, "0.23")
+
+    def test_pass_after_path_extending_install_is_trusted_next_run(self):
+        shell_path = os.environ["PATH"]
+        extra = self.tmp / "local-bin"
+        extra.mkdir()
+
+        def install(name, spec):
+            # Like _install_tool_linux: prepend a dir to PATH, then install
+            os.environ["PATH"] = f"{extra}{os.pathsep}{shell_path}"
+            self._install(name, spec)
+
+        with mock.patch.object(preflight, "_auto_install", side_effect=install):
+            self.assertTrue(preflight.run_preflight(verbose=False))
+        os.environ["PATH"] = shell_path   # the next run's shell
+        self.assertIsNotNone(preflight._recent_pass())
+
+    def test_binary_upgraded_in_place_is_rechecked(self):
+        tool = self._install("kind", {})
+        self._save_pass()
+        st = tool.stat()
+        os.utime(tool, (st.st_atime, st.st_mtime + 10))
+        self.assertIsNone(preflight._recent_pass())
+
+    def test_binary_shadowed_on_same_path_is_rechecked(self):
+        front = self.tmp / "front"
+        front.mkdir()
+        os.environ["PATH"] = f"{front}{os.pathsep}{self.bin}"
+        self._install("kind", {})
+        self._save_pass()
+        shadow = front / "kind"
+        shadow.write_bytes((self.bin / "kind").read_bytes())
+        shadow.chmod(0o755)
+        self.assertIsNone(preflight._recent_pass())
+
+
+class PollDockerTest(unittest.TestCase):
+
+    def test_running_daemon_detected_on_first_poll(self):
+        sleeps = []
+        with mock.patch.object(preflight.time, "sleep", side_effect=sleeps.append), \
+             mock.patch.object(preflight, "_docker_socket_present", return_value=True), \
+             mock.patch.object(preflight, "_docker_running", return_value=True) as running:
+            self.assertTrue(preflight._poll_docker(120))
+        self.assertEqual(sleeps, [0.25])
+        running.assert_called_once()
+
+    def test_probes_every_poll_once_socket_exists(self):
+        with mock.patch.object(preflight.time, "sleep"), \
+             mock.patch.object(preflight, "_docker_socket_present", return_value=True), \
+             mock.patch.object(preflight, "_docker_running",
+                               side_effect=[False, False, True]) as running:
+            self.assertTrue(preflight._poll_docker(120))
+        self.assertEqual(running.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()